@@ -9,13 +9,76 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+from glob import glob
+import requests
+import asyncio
+import aiohttp
+from lxml import etree
+from lxml import html as lxml_html
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Lock
+from multiprocessing.util import Finalize
+from contextlib import nullcontext
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+HEADERS = {'User-Agent': USER_AGENT}
+BLOCKED_URLS = ['*.css', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff', '*.woff2', '*google-analytics*', '*googletagmanager*', '*doubleclick*']
+
+
+def _downcast_numeric(series):
+    """Parse a text column as numbers, shrinking whole-number columns to the smallest int dtype"""
+    numeric = pd.to_numeric(series, errors='coerce')
+    if pd.api.types.is_integer_dtype(numeric):
+        return pd.to_numeric(numeric, downcast='integer')
+    # Keep fractional stats as float64 - float32 shows up as noise like 22.10000038 in Excel
+    return numeric
+
+
+def _strip_text(series):
+    """Strip whitespace from the text in a column, leaving numbers and blanks untouched"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    stripped = series.str.strip()
+    # .str gives NaN for cells that aren't text (e.g. numbers read back from Excel)
+    return stripped.where(stripped.notna(), series)
+
 
 class BartTorvikScraper:
-    def __init__(self):
+    # The table structure has issues with pandas parsing:
+    # - "Player" column actually contains Class (Jr, Sr, So, Fr)
+    # - Player name is in cell 4 (the actual player name)
+    #
+    # The header row has columns at certain positions, but the actual data values
+    # are offset. We need to map based on actual data positions:
+    # Header positions: 0=RK, 2=PLAYER (class area), 4=PLAYER (name area), 6=TEAM, 7=CONF, 9=MIN%, 10=PRPG!, 12=BPM, 15=ORTG, 17=USG, 18=EFG, 19=TS, 20=OR, 21=DR, 22=AST, 23=TO, 25=BLK, 26=STL, 27=FTR, 33=2P, 35=3P/100, 36=3P
+    # Data positions: (column, cell index) pairs below, in cell order
+    _FIELD_MAP = (
+        ('Rk', 0), ('Class', 2), ('Player', 4), ('Team', 6), ('Conf', 7), ('Min%', 10), ('PRPG!', 11),
+        ('BPM', 13), ('ORtg', 16), ('Usg', 18), ('eFG', 19), ('TS', 20), ('OR', 21), ('DR', 22),
+        ('Ast', 23), ('TO', 24), ('Blk', 26), ('Stl', 27), ('FTR', 28),
+        ('2P', 39),  # percentage cell, header at 33
+        ('3P/100', 41),
+        ('3P', 43)  # percentage cell, header at 36
+    )
+    # Selects just the mapped cells of a row (XPath positions are 1-based), in cell order
+    _FIELD_XPATH = etree.XPath(" | ".join(f"./td[{position + 1}]" for _, position in _FIELD_MAP))
+    
+    def __init__(self, driver_path=None, install_lock=None):
         self.base_url = "https://barttorvik.com/playerstat.php"
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.excel_path = os.path.join(self.script_dir, "battorvikPlayerData.xlsx")
+        self.parquet_dir = os.path.join(self.script_dir, "battorvikPlayerData")
+        # Year files in the parquet store younger than this are reused instead of re-scraped
+        self.cache_max_age = 30 * 24 * 60 * 60  # 30 days in seconds
         self.driver = None
+        # chromedriver binary, resolved by the caller or on the first browser start;
+        # install_lock keeps worker processes from running the install at the same time
+        self.driver_path = driver_path
+        self.install_lock = install_lock
+        # Large enough to return every player in one page
+        self.page_size = 5000
+        # Rows the site shows before "Show 100 more"; a full season has thousands
+        self.default_page_rows = 100
         # Define the columns we want to keep (includes Class)
         self.desired_columns = ['Rk', 'Player', 'Class', 'Team', 'Conf', 'Min%', 'PRPG!', 'BPM', 'ORtg', 'Usg', 'eFG', 'TS', 'OR', 'DR', 'Ast', 'TO', 'Blk', 'Stl', 'FTR', '2P', '3P/100', '3P']
         
@@ -27,10 +90,23 @@ class BartTorvikScraper:
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument(f'user-agent={USER_AGENT}')
+            # Don't download images or fonts - only the table data is needed
+            # (stylesheets have no content setting, they're blocked via BLOCKED_URLS)
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2
+            })
             
-            service = Service(ChromeDriverManager().install())
+            if self.driver_path is None:
+                with self.install_lock or nullcontext():
+                    self.driver_path = ChromeDriverManager().install()
+            service = Service(self.driver_path)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # Block remaining heavy assets and trackers at the network layer
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
         return self.driver
         
     def close_driver(self):
@@ -39,164 +115,206 @@ class BartTorvikScraper:
             self.driver.quit()
             self.driver = None
         
+    def get_partition_path(self, year):
+        """Return the parquet store file holding a single year"""
+        return os.path.join(self.parquet_dir, f"year={year}.parquet")
+    
+    def is_cached(self, year):
+        """Check whether the parquet store already holds a recent enough file for this year"""
+        partition_path = self.get_partition_path(year)
+        return os.path.exists(partition_path) and time.time() - os.path.getmtime(partition_path) < self.cache_max_age
+    
     def get_url(self, year):
         """Construct URL with year parameter using f-string"""
         # Format: start date is November 1 of previous year, end date is May 1 of current year
         return f"{self.base_url}?link=y&year={year}&start={year-1}1101&end={year}0501"
     
-    def scrape_data(self, year):
-        """Scrape player statistics from Bart Torvik website"""
+    def get_full_table_url(self, year):
+        """Construct URL that asks for the whole table in a single page"""
+        return f"{self.get_url(year)}&top={self.page_size}"
+    
+    def _parse_table_rows(self, html):
+        """Return the text of the mapped cells (see _FIELD_MAP) for each data row of the player stats table"""
+        tree = lxml_html.fromstring(html)
+        tables = tree.xpath('//table')
+        if len(tables) < 2:
+            raise ValueError("Player stats table not found")
+        
+        rows = list(tables[1].iter('tr'))  # Player stats table
+        if len(rows) < 2:
+            raise ValueError("No data rows found in table")
+        
+        # Skip header row
+        return [[cell.text_content() for cell in self._FIELD_XPATH(row)] for row in rows[1:]]
+    
+    def _fetch_static_rows(self, year, html=None):
+        """Fetch the full player table with a single HTTP request (no browser)"""
+        if html is None:
+            response = requests.get(self.get_full_table_url(year), headers=HEADERS, timeout=30)
+            response.raise_for_status()
+            html = response.text
+        
+        # If the page still offers "Show 100 more" the table is paginated and incomplete
+        if 'show 100 more' in html.lower():
+            raise ValueError("Page returned a paginated table")
+        
+        # A page that ignored top= (or whose cells no longer line up with _FIELD_MAP)
+        # only yields a page's worth of usable rows, so let the browser handle it
+        data_cells = [cells for cells in self._parse_table_rows(html) if len(cells) == len(self._FIELD_MAP)]
+        if len(data_cells) <= self.default_page_rows:
+            raise ValueError(f"Only {len(data_cells)} complete rows in the full table")
+        
+        return data_cells
+    
+    async def fetch_pages(self, years, max_concurrency=5):
+        """Fetch the full-table page for several years concurrently, keyed by year"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(session, year):
+            # Limit concurrent requests to stay polite to the site
+            async with semaphore:
+                try:
+                    async with session.get(self.get_full_table_url(year)) as response:
+                        response.raise_for_status()
+                        return year, await response.text()
+                except Exception as e:
+                    print(f"    Prefetch failed for year {year}: {e}")
+                    return year, None
+        
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+            results = await asyncio.gather(*[fetch(session, year) for year in years])
+        return {year: text for year, text in results if text is not None}
+    
+    def _count_rows(self, driver):
+        """Count rows in the player stats table with a single script call"""
+        return driver.execute_script(
+            "const tables = document.querySelectorAll('table');"
+            "return tables.length > 1 ? tables[1].rows.length : 0;"
+        )
+    
+    def _wait_rows_increase(self, driver, previous_count, timeout=10):
+        """Wait until the player stats table has more than previous_count rows and return the new count"""
+        def more_rows(d):
+            row_count = self._count_rows(d)
+            return row_count if row_count > previous_count else False
+        return WebDriverWait(driver, timeout).until(more_rows)
+    
+    def _load_rows_with_driver(self, year):
+        """Load the full player table in a browser and return the text of each data row"""
         url = self.get_url(year)
         driver = self._get_driver()
         
-        try:
-            # Navigate to the URL
-            driver.get(url)
-            
-            # Wait for the page to load and JavaScript to execute
-            wait = WebDriverWait(driver, 20)
-            
-            # Wait for the table to be present
-            wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
-            
-            # Additional wait for dynamic content to load
-            time.sleep(5)
-            
-            # Click "Show 100 more" button repeatedly until all data is loaded
-            print(f"    Loading all data for year {year}...")
-            max_clicks = 30  # Safety limit
-            clicks = 0
-            
-            for i in range(max_clicks):
-                try:
-                    # Try to find the Load More link/button
-                    load_more = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.XPATH, 
-                            '//a[contains(translate(text(), "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"), "SHOW 100 MORE")]'))
-                    )
-                    # Click using JavaScript to avoid issues
-                    driver.execute_script("arguments[0].click();", load_more)
-                    clicks += 1
-                    time.sleep(2)  # Wait for new rows to load
-                    
-                    if clicks % 5 == 0:
-                        # Check current row count
-                        tables = driver.find_elements(By.TAG_NAME, 'table')
-                        if len(tables) > 1:
-                            rows = tables[1].find_elements(By.TAG_NAME, 'tr')
-                            print(f"    Loaded {len(rows)} rows so far...")
-                except Exception:
-                    # No more Load More button found, all data loaded
-                    break
-            
-            print(f"    Clicked 'Load More' {clicks} times. Extracting table...")
-            time.sleep(3)  # Final wait for all data to render
-            
-            # Parse the table directly from Selenium to correctly extract player names and class
-            # The table structure has issues with pandas parsing:
-            # - "Player" column actually contains Class (Jr, Sr, So, Fr)
-            # - Player name is in cell 4 (the actual player name)
-            
-            # Get the table directly from Selenium to parse correctly
-            tables = driver.find_elements(By.TAG_NAME, 'table')
-            if len(tables) < 2:
-                raise ValueError("Player stats table not found")
-            
-            player_table = tables[1]  # Player stats table
-            rows = player_table.find_elements(By.TAG_NAME, 'tr')
-            
-            if len(rows) < 2:
-                raise ValueError("No data rows found in table")
-            
-            # Parse header row to find column positions
-            header_row = rows[0]
-            header_cells = header_row.find_elements(By.TAG_NAME, 'th')
-            if len(header_cells) == 0:
-                header_cells = header_row.find_elements(By.TAG_NAME, 'td')
-            
-            # Find column positions
-            header_texts = [cell.text.strip() for cell in header_cells]
-            
-            # Parse data rows
-            # The header row has columns at certain positions, but the actual data values
-            # are offset. We need to map based on actual data positions:
-            # Header positions: 0=RK, 2=PLAYER (class area), 4=PLAYER (name area), 6=TEAM, 7=CONF, 9=MIN%, 10=PRPG!, 12=BPM, 15=ORTG, 17=USG, 18=EFG, 19=TS, 20=OR, 21=DR, 22=AST, 23=TO, 25=BLK, 26=STL, 27=FTR, 33=2P, 35=3P/100, 36=3P
-            # Data positions: 0=RK, 2=Class, 4=Player Name, 6=Team, 7=Conf, 10=Min%, 11=PRPG!, 13=BPM, 16=ORtg, 18=Usg, 19=eFG, 20=TS, 21=OR, 22=DR, 23=Ast, 24=TO, 26=Blk, 27=Stl, 28=FTR, 33=2P, 35=3P/100, 36=3P
-            data_rows = []
-            for row in rows[1:]:  # Skip header row
-                cells = row.find_elements(By.TAG_NAME, 'td')
-                if len(cells) < 20:  # Skip rows that don't have enough cells
-                    continue
+        # Navigate to the URL
+        driver.get(url)
+        
+        # Wait for the page to load and JavaScript to execute
+        wait = WebDriverWait(driver, 20)
+        
+        # Wait for the table to be present
+        wait.until(EC.presence_of_element_located((By.TAG_NAME, "table")))
+        
+        # Wait for the player stats table to be populated by JavaScript
+        self._wait_rows_increase(driver, 1, timeout=20)
+        
+        # Click "Show 100 more" button repeatedly until all data is loaded
+        print(f"    Loading all data for year {year}...")
+        max_clicks = 30  # Safety limit
+        clicks = 0
+        
+        for i in range(max_clicks):
+            try:
+                # Try to find the Load More link/button
+                load_more = WebDriverWait(driver, 3).until(
+                    EC.element_to_be_clickable((By.XPATH, 
+                        '//a[contains(translate(text(), "abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ"), "SHOW 100 MORE")]'))
+                )
+                previous_row_count = self._count_rows(driver)
+                
+                # Click using JavaScript to avoid issues
+                driver.execute_script("arguments[0].click();", load_more)
+                clicks += 1
                 
-                # Extract values based on actual data cell positions
-                row_data = {}
-                if len(cells) > 0:
-                    row_data['Rk'] = cells[0].text.strip()
-                if len(cells) > 2:
-                    row_data['Class'] = cells[2].text.strip()  # Class (Jr, Sr, So, Fr)
-                if len(cells) > 4:
-                    row_data['Player'] = cells[4].text.strip()  # Actual player name
-                if len(cells) > 6:
-                    row_data['Team'] = cells[6].text.strip()
-                if len(cells) > 7:
-                    row_data['Conf'] = cells[7].text.strip()
-                if len(cells) > 10:
-                    row_data['Min%'] = cells[10].text.strip()  # Data is at cell 10, header at cell 9
-                if len(cells) > 11:
-                    row_data['PRPG!'] = cells[11].text.strip()  # Data is at cell 11, header at cell 10
-                if len(cells) > 13:
-                    row_data['BPM'] = cells[13].text.strip()  # Data is at cell 13, header at cell 12
-                if len(cells) > 16:
-                    row_data['ORtg'] = cells[16].text.strip()  # Data is at cell 16, header at cell 15
-                if len(cells) > 18:
-                    row_data['Usg'] = cells[18].text.strip()  # Data is at cell 18, header at cell 17
-                if len(cells) > 19:
-                    row_data['eFG'] = cells[19].text.strip()  # Data is at cell 19, header at cell 18
-                if len(cells) > 20:
-                    row_data['TS'] = cells[20].text.strip()  # Data is at cell 20, header at cell 19
-                if len(cells) > 21:
-                    row_data['OR'] = cells[21].text.strip()  # Data is at cell 21, header at cell 20
-                if len(cells) > 22:
-                    row_data['DR'] = cells[22].text.strip()  # Data is at cell 22, header at cell 21
-                if len(cells) > 23:
-                    row_data['Ast'] = cells[23].text.strip()  # Data is at cell 23, header at cell 22
-                if len(cells) > 24:
-                    row_data['TO'] = cells[24].text.strip()  # Data is at cell 24, header at cell 23
-                if len(cells) > 26:
-                    row_data['Blk'] = cells[26].text.strip()  # Data is at cell 26, header at cell 25
-                if len(cells) > 27:
-                    row_data['Stl'] = cells[27].text.strip()  # Data is at cell 27, header at cell 26
-                if len(cells) > 28:
-                    row_data['FTR'] = cells[28].text.strip()  # Data is at cell 28, header at cell 27
-                if len(cells) > 39:
-                    row_data['2P'] = cells[39].text.strip()  # Data is at cell 39 (percentage), header at cell 33
-                if len(cells) > 41:
-                    row_data['3P/100'] = cells[41].text.strip()  # Data is at cell 41, header at cell 35
-                if len(cells) > 43:
-                    row_data['3P'] = cells[43].text.strip()  # Data is at cell 43 (percentage), header at cell 36
+                # Wait only as long as it takes for the new rows to appear
+                row_count = self._wait_rows_increase(driver, previous_row_count)
                 
-                data_rows.append(row_data)
+                if clicks % 5 == 0:
+                    print(f"    Loaded {row_count} rows so far...")
+            except Exception:
+                # No more Load More button found (or no new rows), all data loaded
+                break
+        
+        print(f"    Clicked 'Load More' {clicks} times. Extracting table...")
+        
+        # Parse the rendered page in-process instead of querying the browser per cell
+        return self._parse_table_rows(driver.page_source)
+    
+    def _build_dataframe(self, data_cells, year):
+        """Turn the mapped cell text of each row into a DataFrame of the desired columns"""
+        # Rows arrive already reduced to the _FIELD_MAP cells; rows too short to hold
+        # every field come back with fewer values and are skipped
+        rows = [cells for cells in data_cells if len(cells) == len(self._FIELD_MAP)]
+        
+        # Create DataFrame from parsed data, then put columns in desired order
+        df = pd.DataFrame(rows, columns=[col for col, _ in self._FIELD_MAP])
+        df = self._convert_dtypes(df[self.desired_columns])
+        
+        # Add year column to track which year the data is from
+        df['Year'] = year
+        
+        return df
+    
+    def _convert_dtypes(self, df):
+        """Strip the text columns and store labels as categories and stats as numbers"""
+        # Strip whitespace a column at a time rather than once per cell (scraped
+        # columns are raw text; pandas 3 gives these a str dtype, not object)
+        for col in self.desired_columns:
+            df[col] = _strip_text(df[col])
+        
+        # Class, Team and Conf repeat heavily across rows, so store them as categories
+        for col in ['Class', 'Team', 'Conf']:
+            df[col] = df[col].astype('category')
+        
+        # Everything else is a stat - store it as a numeric dtype
+        numeric_cols = [col for col in self.desired_columns if col not in ('Player', 'Team', 'Conf', 'Class')]
+        df[numeric_cols] = df[numeric_cols].apply(_downcast_numeric)
+        
+        return df
+    
+    def scrape_data(self, year, prefetched=None):
+        """Scrape player statistics from Bart Torvik website (optionally from an already fetched page)"""
+        # Skip the scrape entirely if this year was already scraped recently
+        if self.is_cached(year):
+            print(f"    Using cached data for year {year}")
+            return pd.read_parquet(self.get_partition_path(year))
+        
+        try:
+            # Try a single direct request first; fall back to the browser when the
+            # site serves a JavaScript check or only a paginated table
+            try:
+                data_cells = self._fetch_static_rows(year, prefetched)
+            except Exception as e:
+                print(f"    Direct fetch failed for year {year} ({e}), falling back to browser...")
+                data_cells = self._load_rows_with_driver(year)
             
-            # Create DataFrame from parsed data
-            df = pd.DataFrame(data_rows)
+            df = self._build_dataframe(data_cells, year)
             
-            # Only keep desired columns
-            final_columns = [col for col in self.desired_columns if col in df.columns]
-            df = df[final_columns]
+            print(f"    Extracted {len(df)} rows of data with {len(df.columns)} columns")
             
-            # Add year column to track which year the data is from
-            df['Year'] = year
+            # An empty file would be reused as a cached year, so fail the year instead
+            if df.empty:
+                raise ValueError(f"No player rows extracted for year {year}")
             
-            print(f"    Extracted {len(df)} rows of data with {len(df.columns)} columns")
+            # Save the year to the parquet store right away so re-runs can skip it
+            self._write_partition(df, year)
             return df
             
         except Exception as e:
             print(f"Error scraping data for year {year}: {e}")
             raise
     
-    def append_to_excel(self, df):
-        """Append DataFrame to existing Excel file"""
-        # Ensure df has Year column and all desired columns
+    def _select_columns(self, df):
+        """Return df with exactly the desired columns plus Year, in order"""
         desired_cols_with_year = self.desired_columns + ['Year']
         
         # Make sure df has all required columns
@@ -205,47 +323,79 @@ class BartTorvikScraper:
                 df[col] = None
         
         # Select only desired columns in correct order
-        df = df[desired_cols_with_year]
+        return df[desired_cols_with_year]
+    
+    def _write_partition(self, df, year):
+        """Atomically write one year's file so an interrupted run never leaves a partial file"""
+        os.makedirs(self.parquet_dir, exist_ok=True)
+        partition_path = self.get_partition_path(year)
+        tmp_path = f"{partition_path}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, partition_path)
+    
+    def _write_partitions(self, df):
+        """Write each year in the DataFrame to its own file in the parquet store"""
+        # One file per year, so re-running a year replaces it instead of duplicating rows
+        for year, year_df in df.groupby('Year'):
+            self._write_partition(year_df, year)
+    
+    def _read_excel(self):
+        """Read the existing Excel file, preferring the much faster calamine reader"""
+        try:
+            return pd.read_excel(self.excel_path, sheet_name='Sheet1', engine='calamine')
+        except (ImportError, ValueError):
+            # python-calamine not installed (or pandas too old to know the engine)
+            return pd.read_excel(self.excel_path, sheet_name='Sheet1', engine='openpyxl')
+    
+    def migrate_excel(self):
+        """Seed an empty parquet store from an existing Excel file"""
+        if glob(os.path.join(self.parquet_dir, 'year=*.parquet')) or not os.path.exists(self.excel_path):
+            return
         
-        # Check for existing file
-        existing_df = None
-        if os.path.exists(self.excel_path):
-            try:
-                existing_df = pd.read_excel(self.excel_path, sheet_name='Sheet1', engine='openpyxl')
-                # Check if file actually has data
-                if existing_df.empty or len(existing_df.columns) == 0:
-                    existing_df = None
-                    print(f"Existing file was empty, starting fresh")
-            except Exception as e:
-                print(f"Could not read existing file: {e}, starting fresh")
-                existing_df = None
-        
-        # Process data
-        if existing_df is not None and not existing_df.empty:
-            # Ensure existing_df has the same columns
-            for col in desired_cols_with_year:
-                if col not in existing_df.columns:
-                    existing_df[col] = None
-            
-            # Select only desired columns
-            existing_df = existing_df[desired_cols_with_year]
-            
-            # Filter out rows for the same year (to avoid duplicates when re-running)
-            if 'Year' in df.columns and 'Year' in existing_df.columns:
-                year_to_append = df['Year'].iloc[0] if len(df) > 0 else None
-                if year_to_append is not None:
-                    existing_df = existing_df[existing_df['Year'] != year_to_append]
-            
-            # Combine existing and new data
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            print(f"Appended {len(df)} new rows to existing {len(existing_df)} rows")
-        else:
-            # No existing data or file doesn't exist, use new data
-            combined_df = df
-            if existing_df is None:
-                print(f"Creating new file with {len(df)} rows")
-            else:
-                print(f"File was empty, writing {len(df)} new rows")
+        try:
+            existing_df = self._read_excel()
+        except Exception as e:
+            print(f"Could not read existing file: {e}, starting fresh")
+            return
+        
+        # Check if file actually has data
+        if existing_df.empty or 'Year' not in existing_df.columns:
+            print(f"Existing file was empty, starting fresh")
+            return
+        
+        # Rows without a usable Year can't go in a year file; the rest need int years
+        # so their files are named like the scraped ones (year=2024, not year=2024.0)
+        existing_df['Year'] = pd.to_numeric(existing_df['Year'], errors='coerce')
+        existing_df = existing_df.dropna(subset=['Year'])
+        if existing_df.empty:
+            print(f"Existing file had no rows with a Year, starting fresh")
+            return
+        existing_df['Year'] = existing_df['Year'].astype(int)
+        
+        print(f"Migrating {len(existing_df)} rows from {self.excel_path} to {self.parquet_dir}")
+        # Give the migrated years the same dtypes as freshly scraped ones
+        self._write_partitions(self._convert_dtypes(self._select_columns(existing_df).copy()))
+        # Date the migrated years by the Excel file so they age out of the cache normally
+        excel_mtime = os.path.getmtime(self.excel_path)
+        for year in existing_df['Year'].unique():
+            os.utime(self.get_partition_path(year), (excel_mtime, excel_mtime))
+    
+    def _read_partitions(self, skip_years=()):
+        """Read every year file in the parquet store except skip_years, one DataFrame per file"""
+        skip_paths = {self.get_partition_path(year) for year in skip_years}
+        partition_paths = sorted(glob(os.path.join(self.parquet_dir, 'year=*.parquet')))
+        return [pd.read_parquet(path) for path in partition_paths if path not in skip_paths]
+    
+    def export_to_excel(self, scraped=None):
+        """Write every year to a single Excel file, taking the years in scraped (year -> DataFrame) from memory"""
+        scraped = scraped or {}
+        # Years scraped this run are already in memory, so only the other years are read from the store
+        frames = self._read_partitions(skip_years=scraped) + list(scraped.values())
+        if not frames:
+            print("No data to export")
+            return self.excel_path
+        combined_df = pd.concat(frames, ignore_index=True).sort_values('Year', kind='stable', ignore_index=True)
+        combined_df = self._select_columns(combined_df)
         
         # Write to Excel file (overwrites the existing sheet)
         try:
@@ -260,41 +410,82 @@ class BartTorvikScraper:
         return self.excel_path
 
 
+# One scraper (and browser session) per worker process, reused across its years
+_worker_scraper = None
+
+
+def _init_worker(driver_path, install_lock):
+    """Create the worker's scraper and quit its browser when the worker exits"""
+    # Selenium is not fork-safe, so each worker builds its own scraper and driver
+    global _worker_scraper
+    _worker_scraper = BartTorvikScraper(driver_path, install_lock)
+    Finalize(_worker_scraper, _worker_scraper.close_driver, exitpriority=10)
+
+
+def scrape_one_year(year, prefetched=None):
+    """Scrape a single year in a worker process and return its DataFrame"""
+    # scrape_data also writes the year to the parquet store (or reuses a cached one),
+    # so a crash mid-run doesn't lose finished years
+    return _worker_scraper.scrape_data(year, prefetched)
+
+
 if __name__ == "__main__":
     scraper = BartTorvikScraper()
+    max_workers = 4
     
-    try:
-        # Loop through years from 2025 to 2008 (inclusive)
-        years = range(2025, 2007, -1)  # Goes from 2025 down to 2008
-        total_years = len(years)
-        successful = 0
-        failed = 0
-        
-        print(f"Starting to scrape data for {total_years} years (2025 to 2008)...")
-        print("=" * 60)
-        
-        for i, year in enumerate(years, 1):
+    # Loop through years from 2025 to 2008 (inclusive)
+    years = range(2025, 2007, -1)
+    total_years = len(years)
+    successful = 0
+    failed = 0
+    scraped = {}
+    
+    # Bring an existing Excel file into the parquet store before checking what's done
+    scraper.migrate_excel()
+    
+    # Years already in the store from an earlier (possibly interrupted) run are
+    # not scraped again
+    remaining_years = [year for year in years if not scraper.is_cached(year)]
+    reused = total_years - len(remaining_years)
+    
+    print(f"Starting to scrape data for {total_years} years (2025 to 2008) with {max_workers} workers...")
+    print(f"Reusing {reused} already scraped years, {len(remaining_years)} left to scrape")
+    print("=" * 60)
+    
+    # Download the full-table pages for every remaining year concurrently up front;
+    # workers parse them and only open a browser when a page is unusable
+    pages = asyncio.run(scraper.fetch_pages(remaining_years))
+    
+    # A year whose page couldn't be downloaded will need a browser, so resolve chromedriver
+    # once here; otherwise workers resolve it (one at a time) only if a page is unusable
+    driver_path = None
+    if any(year not in pages for year in remaining_years):
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            print(f"Could not resolve chromedriver ({e}), workers will retry if they need a browser")
+    
+    # Each year is I/O-bound (browser + network), so run them in parallel processes
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(driver_path, Lock())) as executor:
+        futures = {executor.submit(scrape_one_year, year, pages.get(year)): year for year in remaining_years}
+        for i, future in enumerate(as_completed(futures), 1):
+            year = futures[future]
             try:
-                print(f"\n[{i}/{total_years}] Scraping data for year {year}...")
-                df = scraper.scrape_data(year)
-                print(f"Successfully scraped {len(df)} rows for year {year}")
-                
-                scraper.append_to_excel(df)
+                df = future.result()
+                scraped[year] = df
                 successful += 1
-                print(f"✓ Year {year} completed successfully")
-                
+                print(f"[{i}/{len(remaining_years)}] ✓ Year {year} completed successfully ({len(df)} rows)")
             except Exception as e:
                 failed += 1
-                print(f"✗ Error scraping year {year}: {e}")
-                print(f"Continuing with next year...")
-        
-        print("\n" + "=" * 60)
-        print(f"Scraping completed!")
-        print(f"Successfully scraped: {successful} years")
-        print(f"Failed: {failed} years")
-        print(f"Total years processed: {successful + failed}/{total_years}")
-        
-    finally:
-        # Always close the driver
-        scraper.close_driver()
-        print("\nBrowser driver closed.")
+                print(f"[{i}/{len(remaining_years)}] ✗ Error scraping year {year}: {e}")
+    
+    # Export Excel once: this run's years from memory, reused years from the parquet store
+    if successful or reused:
+        scraper.export_to_excel(scraped)
+    
+    print("\n" + "=" * 60)
+    print(f"Scraping completed!")
+    print(f"Successfully scraped: {successful} years")
+    print(f"Failed: {failed} years")
+    print(f"Reused from earlier runs: {reused} years")
+    print(f"Total years processed: {successful + failed + reused}/{total_years}")
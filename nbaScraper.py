@@ -7,15 +7,66 @@ from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from webdriver_manager.chrome import ChromeDriverManager
 import time
+from glob import glob
+import requests
+import asyncio
+import aiohttp
+import json
+from lxml import html as lxml_html
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import Lock
+from multiprocessing.util import Finalize
+from contextlib import nullcontext
+
+USER_AGENT = 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+HEADERS = {'User-Agent': USER_AGENT}
+BLOCKED_URLS = ['*.css', '*.png', '*.jpg', '*.jpeg', '*.gif', '*.svg', '*.woff', '*.woff2', '*google-analytics*', '*googletagmanager*', '*doubleclick*']
+
+
+def _downcast_numeric(series):
+    """Parse a text column as numbers, shrinking whole-number columns to the smallest int dtype"""
+    numeric = pd.to_numeric(series, errors='coerce')
+    if pd.api.types.is_integer_dtype(numeric):
+        return pd.to_numeric(numeric, downcast='integer')
+    # Keep fractional stats as float64 - float32 shows up as noise like 22.10000038 in Excel
+    return numeric
+
+
+def _strip_text(series):
+    """Strip whitespace from the text in a column, leaving numbers and blanks untouched"""
+    if pd.api.types.is_numeric_dtype(series):
+        return series
+    stripped = series.str.strip()
+    # .str gives NaN for cells that aren't text (e.g. numbers read back from Excel)
+    return stripped.where(stripped.notna(), series)
+
+
+# Player name followed by one or more uppercase team abbreviations (e.g. "De'Aaron FoxSAC/SA")
+_TEAM_RE = re.compile(r'^(.+?)([A-Z]{2,4}(?:/[A-Z]{2,4})*)$')
+# Patterns used by extract_player_name_and_team, compiled once
+_TEAM_MULTI = re.compile(r'^(.+?)([A-Z]{2,4}(?:/[A-Z]{2,4})+)$')
+_TEAM_SINGLE = re.compile(r'^(.+?)([A-Z]{2,4})$')
+_TEAM_PREFIX = re.compile(r'^(.+?)([A-Z]{2,4})')
 
 class NBAScraper:
-    def __init__(self):
+    def __init__(self, driver_path=None, install_lock=None):
         self.base_url = "https://www.espn.com/nba/stats/player/_/season/"
+        self.api_url = "https://site.web.api.espn.com/apis/common/v3/sports/basketball/nba/statistics/byathlete"
         self.script_dir = os.path.dirname(os.path.abspath(__file__))
         self.excel_path = os.path.join(self.script_dir, "nbaPlayerData.xlsx")
+        self.parquet_dir = os.path.join(self.script_dir, "nbaPlayerData")
+        # Year files in the parquet store younger than this are reused instead of re-scraped
+        self.cache_max_age = 30 * 24 * 60 * 60  # 30 days in seconds
         self.driver = None
+        # chromedriver binary, resolved by the caller or on the first browser start;
+        # install_lock keeps worker processes from running the install at the same time
+        self.driver_path = driver_path
+        self.install_lock = install_lock
+        # Stats columns shown on the ESPN player stats page
+        self.stats_columns = ['POS', 'GP', 'MIN', 'PTS', 'FGM', 'FGA', 'FG%', '3PM', '3PA', '3P%', 'FTM', 'FTA', 'FT%', 'REB', 'AST', 'STL', 'BLK', 'TO', 'DD2', 'TD3']
         
     def _get_driver(self):
         """Initialize and return a Chrome WebDriver instance"""
@@ -25,10 +76,23 @@ class NBAScraper:
             chrome_options.add_argument('--no-sandbox')
             chrome_options.add_argument('--disable-dev-shm-usage')
             chrome_options.add_argument('--disable-gpu')
-            chrome_options.add_argument('user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+            chrome_options.add_argument(f'user-agent={USER_AGENT}')
+            # Don't download images or fonts - only the table data is needed
+            # (stylesheets have no content setting, they're blocked via BLOCKED_URLS)
+            chrome_options.add_experimental_option('prefs', {
+                'profile.managed_default_content_settings.images': 2,
+                'profile.managed_default_content_settings.fonts': 2
+            })
             
-            service = Service(ChromeDriverManager().install())
+            if self.driver_path is None:
+                with self.install_lock or nullcontext():
+                    self.driver_path = ChromeDriverManager().install()
+            service = Service(self.driver_path)
             self.driver = webdriver.Chrome(service=service, options=chrome_options)
+            
+            # Block remaining heavy assets and trackers at the network layer
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': BLOCKED_URLS})
         return self.driver
         
     def close_driver(self):
@@ -37,10 +101,24 @@ class NBAScraper:
             self.driver.quit()
             self.driver = None
         
+    def get_partition_path(self, year):
+        """Return the parquet store file holding a single year"""
+        return os.path.join(self.parquet_dir, f"year={year}.parquet")
+    
+    def is_cached(self, year):
+        """Check whether the parquet store already holds a recent enough file for this year"""
+        partition_path = self.get_partition_path(year)
+        return os.path.exists(partition_path) and time.time() - os.path.getmtime(partition_path) < self.cache_max_age
+    
     def get_url(self, year):
         """Construct URL with year parameter"""
         return f"{self.base_url}{year}/seasontype/2"
     
+    def get_api_url(self, year):
+        """Construct ESPN statistics API URL that returns every player in one page"""
+        return (f"{self.api_url}?region=us&lang=en&contentorigin=espn&isqualified=false"
+                f"&limit=1000&sort=offensive.avgPoints:desc&season={year}&seasontype=2")
+    
     def extract_player_name_and_team(self, name_text):
         """Extract player name and team from ESPN format (e.g., 'ray allenMIA' or 'Shai Gilgeous-AlexanderOKC')"""
         # ESPN format: PlayerNameTeam (e.g., "ray allenMIA", "Shai Gilgeous-AlexanderOKC")
@@ -49,13 +127,13 @@ class NBAScraper:
         if '/' in name_text:
             # Find where the team part starts (first uppercase team abbreviation)
             # Pattern: player name (may have mixed case) followed by uppercase team abbreviation(s) with slash
-            match = re.match(r'^(.+?)([A-Z]{2,4}(?:/[A-Z]{2,4})+)$', name_text)
+            match = _TEAM_MULTI.match(name_text)
             if match:
                 player_name = match.group(1)
                 team = match.group(2)
                 return player_name, team
             # Fallback: try without the slash pattern
-            match = re.match(r'^(.+?)([A-Z]{2,4})', name_text)
+            match = _TEAM_PREFIX.match(name_text)
             if match:
                 player_name = match.group(1)
                 # Get everything from the first team abbreviation to the end
@@ -63,7 +141,7 @@ class NBAScraper:
                 return player_name, team
         else:
             # Standard format: PlayerNameTEAM
-            match = re.match(r'^(.+?)([A-Z]{2,4})$', name_text)
+            match = _TEAM_SINGLE.match(name_text)
             if match:
                 player_name = match.group(1)
                 team = match.group(2)
@@ -71,201 +149,361 @@ class NBAScraper:
         # If no match, return as-is with empty team
         return name_text, ""
     
-    def scrape_data(self, year):
-        """Scrape player statistics from ESPN website"""
-        url = self.get_url(year)
-        driver = self._get_driver()
+    def split_player_and_team(self, names):
+        """Vectorized extract_player_name_and_team over a whole column of ESPN names"""
+        names = pd.Series(names, dtype=object).str.strip()
+        extracted = names.str.extract(_TEAM_RE.pattern)
         
-        try:
-            # Navigate to the URL
-            driver.get(url)
-            
-            # Wait for the page to load and JavaScript to execute
-            wait = WebDriverWait(driver, 20)
-            
-            # Wait for the tables to be present
-            wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.Table")))
-            
-            # Additional wait for dynamic content to load
-            time.sleep(3)
+        # Names the single pattern can't handle (no match, or a slash name that only
+        # matched a single team) go through the per-row parser and its fallbacks
+        has_slash = names.str.contains('/', regex=False)
+        slash_in_team = extracted[1].str.contains('/', regex=False, na=False)
+        unmatched = extracted[0].isna() | (has_slash & ~slash_in_team)
+        if unmatched.any():
+            fallback = names[unmatched].map(self.extract_player_name_and_team)
+            extracted.loc[unmatched, 0] = fallback.str[0]
+            extracted.loc[unmatched, 1] = fallback.str[1]
+        
+        return extracted[0], extracted[1]
+    
+    def _fetch_api_rows(self, year, text=None):
+        """Fetch every player for a season from ESPN's statistics JSON API (no browser)"""
+        if text is None:
+            response = requests.get(self.get_api_url(year), headers=HEADERS, timeout=30)
+            response.raise_for_status()
+            text = response.text
+        payload = json.loads(text)
+        
+        # A response split over several pages is incomplete - let the browser path handle it
+        athletes = payload.get('athletes', [])
+        pagination = payload.get('pagination', {})
+        if pagination.get('pages', 1) > 1 or pagination.get('count', len(athletes)) != len(athletes):
+            raise ValueError(f"ESPN API returned {len(athletes)} of {pagination.get('count')} players")
+        
+        # Stat labels are listed once per category at the top level of the response;
+        # each athlete's categories carry the matching values under the same name
+        category_labels = {category.get('name'): category.get('labels', []) for category in payload.get('categories', [])}
+        
+        data_rows = []
+        for rk, entry in enumerate(athletes, 1):
+            athlete = entry.get('athlete', {})
+            row_data = {
+                'RK': str(rk),
+                'Player': athlete.get('displayName', ''),
+                'Team': athlete.get('teamShortName', ''),
+                'POS': (athlete.get('position') or {}).get('abbreviation', '')
+            }
             
-            # Click "Show More" repeatedly to load all players (~600 per year)
-            print(f"    Loading all players for year {year}...")
-            max_clicks = 20  # Safety limit (should be enough for ~600 players: 50 initial + ~10 clicks * 50 = 550+)
-            clicks = 0
-            previous_row_count = 0
+            # Add the stats columns shown on the ESPN stats page
+            for category in entry.get('categories', []):
+                labels = category_labels.get(category.get('name'), [])
+                for label, value in zip(labels, category.get('totals', [])):
+                    if label in self.stats_columns and label not in row_data:
+                        row_data[label] = value
             
-            for i in range(max_clicks):
+            data_rows.append(row_data)
+        
+        if not data_rows:
+            raise ValueError("No players returned by ESPN API")
+        
+        missing_columns = [col for col in self.stats_columns if col not in data_rows[0]]
+        if missing_columns:
+            raise ValueError(f"ESPN API response is missing columns {missing_columns}")
+        
+        return data_rows
+    
+    async def fetch_pages(self, years, max_concurrency=5):
+        """Fetch the ESPN API response for several years concurrently, keyed by year"""
+        semaphore = asyncio.Semaphore(max_concurrency)
+        
+        async def fetch(session, year):
+            # Limit concurrent requests to stay polite to the site
+            async with semaphore:
                 try:
-                    # Try to find the Show More link/button
-                    show_more = WebDriverWait(driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, "a.loadMore__link, a.AnchorLink.loadMore__link"))
-                    )
-                    
-                    # Get current row count before clicking
-                    tables_before = driver.find_elements(By.CSS_SELECTOR, "table.Table")
-                    if len(tables_before) >= 2:
-                        previous_row_count = len(tables_before[0].find_elements(By.CSS_SELECTOR, 'tbody tr'))
-                    
-                    # Click using JavaScript to avoid issues
-                    driver.execute_script("arguments[0].click();", show_more)
-                    clicks += 1
-                    
-                    # Wait for new rows to load
-                    time.sleep(2)
-                    
-                    # Check if new rows were loaded
-                    tables_after = driver.find_elements(By.CSS_SELECTOR, "table.Table")
-                    if len(tables_after) >= 2:
-                        current_row_count = len(tables_after[0].find_elements(By.CSS_SELECTOR, 'tbody tr'))
-                        print(f"    Clicked 'Show More' {clicks} times. Now showing {current_row_count} players...")
-                        
-                        # If no new rows were loaded, we've reached the end
-                        if current_row_count == previous_row_count:
-                            print(f"    No new rows loaded, all data available")
-                            break
-                        previous_row_count = current_row_count
-                    
-                except Exception:
-                    # No more Show More button found, all data loaded
-                    print(f"    'Show More' button not found after {clicks} clicks, all data loaded")
-                    break
-            
-            print(f"    Finished loading data. Extracting table...")
-            time.sleep(2)  # Final wait for all data to render
+                    async with session.get(self.get_api_url(year)) as response:
+                        response.raise_for_status()
+                        return year, await response.text()
+                except Exception as e:
+                    print(f"    Prefetch failed for year {year}: {e}")
+                    return year, None
+        
+        timeout = aiohttp.ClientTimeout(total=30)
+        async with aiohttp.ClientSession(headers=HEADERS, timeout=timeout) as session:
+            results = await asyncio.gather(*[fetch(session, year) for year in years])
+        return {year: text for year, text in results if text is not None}
+    
+    def _parse_tables_html(self, html):
+        """Return stats headers plus the cell text of each name-table and stats-table row"""
+        tree = lxml_html.fromstring(html)
+        
+        # Get both tables - ESPN splits the stats across two tables
+        tables = tree.xpath('//table[contains(concat(" ", normalize-space(@class), " "), " Table ")]')
+        if len(tables) < 2:
+            raise ValueError(f"Expected 2 tables but found {len(tables)}")
+        
+        # Table 0: RK and Name (player name + team)
+        name_table = tables[0]
+        # Table 1: All the stats (POS, GP, MIN, PTS, etc.)
+        stats_table = tables[1]
+        
+        # Get headers from stats table
+        stats_headers = [cell.text_content().strip() for cell in stats_table.xpath('(.//thead)[1]//th')]
+        
+        # Get data rows from both tables (whitespace is stripped per column later)
+        name_rows = [[cell.text_content() for cell in row.iter('td')] for row in name_table.xpath('.//tbody//tr')]
+        stats_rows = [[cell.text_content() for cell in row.iter('td')] for row in stats_table.xpath('.//tbody//tr')]
+        
+        return stats_headers, name_rows, stats_rows
+    
+    def _count_rows(self, driver):
+        """Count player rows in the name table with a single script call"""
+        return driver.execute_script(
+            "const tables = document.querySelectorAll('table.Table');"
+            "return tables.length > 0 ? tables[0].querySelectorAll('tbody tr').length : 0;"
+        )
+    
+    def _wait_rows_increase(self, driver, previous_count, timeout=10):
+        """Wait until the name table has more than previous_count rows and return the new count"""
+        def more_rows(d):
+            row_count = self._count_rows(d)
+            return row_count if row_count > previous_count else False
+        return WebDriverWait(driver, timeout).until(more_rows)
+    
+    def _load_rows_with_driver(self, year):
+        """Load every player for a season in a browser and return one dict per row"""
+        url = self.get_url(year)
+        driver = self._get_driver()
+        
+        # Navigate to the URL
+        driver.get(url)
+        
+        # Wait for the page to load and JavaScript to execute
+        wait = WebDriverWait(driver, 20)
+        
+        # Wait for the tables to be present
+        wait.until(EC.presence_of_element_located((By.CSS_SELECTOR, "table.Table")))
+        
+        # Wait for the first rows to be rendered by JavaScript
+        self._wait_rows_increase(driver, 0, timeout=20)
+        
+        # Click "Show More" repeatedly to load all players (~600 per year)
+        print(f"    Loading all players for year {year}...")
+        max_clicks = 20  # Safety limit (should be enough for ~600 players: 50 initial + ~10 clicks * 50 = 550+)
+        clicks = 0
+        
+        for i in range(max_clicks):
+            try:
+                # Try to find the Show More link/button
+                show_more = WebDriverWait(driver, 3).until(
+                    EC.element_to_be_clickable((By.CSS_SELECTOR, "a.loadMore__link, a.AnchorLink.loadMore__link"))
+                )
+            except Exception:
+                # No more Show More button found, all data loaded
+                print(f"    'Show More' button not found after {clicks} clicks, all data loaded")
+                break
             
-            # Get both tables - ESPN splits the stats across two tables
-            tables = driver.find_elements(By.CSS_SELECTOR, "table.Table")
+            # Get current row count before clicking
+            previous_row_count = self._count_rows(driver)
             
-            if len(tables) < 2:
-                raise ValueError(f"Expected 2 tables but found {len(tables)}")
+            # Click using JavaScript to avoid issues
+            driver.execute_script("arguments[0].click();", show_more)
+            clicks += 1
             
-            # Table 0: RK and Name (player name + team)
-            name_table = tables[0]
-            # Table 1: All the stats (POS, GP, MIN, PTS, etc.)
-            stats_table = tables[1]
+            # Wait only as long as it takes for the new rows to appear
+            try:
+                current_row_count = self._wait_rows_increase(driver, previous_row_count)
+            except TimeoutException:
+                # If no new rows were loaded, we've reached the end
+                print(f"    No new rows loaded, all data available")
+                break
+            print(f"    Clicked 'Show More' {clicks} times. Now showing {current_row_count} players...")
+        
+        print(f"    Finished loading data. Extracting table...")
+        
+        # Parse the rendered page in-process instead of querying the browser per cell
+        stats_headers, name_rows, stats_rows = self._parse_tables_html(driver.page_source)
+        
+        if len(name_rows) != len(stats_rows):
+            print(f"    Warning: Name table has {len(name_rows)} rows, stats table has {len(stats_rows)} rows")
+        
+        # Parse all rows and combine data
+        data_rows = []
+        name_texts = []
+        min_rows = min(len(name_rows), len(stats_rows))
+        
+        for i in range(min_rows):
+            # Parse name table row
+            name_cells = name_rows[i]
+            if len(name_cells) < 2:
+                continue
             
-            # Get headers from stats table
-            stats_headers = []
-            stats_header_row = stats_table.find_element(By.TAG_NAME, 'thead')
-            stats_header_cells = stats_header_row.find_elements(By.TAG_NAME, 'th')
-            stats_headers = [cell.text.strip() for cell in stats_header_cells]
+            rk = name_cells[0]
+            name_text = name_cells[1]
             
-            # Get data rows from both tables
-            name_rows = name_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
-            stats_rows = stats_table.find_elements(By.CSS_SELECTOR, 'tbody tr')
+            # Parse stats table row
+            stats_cells = stats_rows[i]
+            if len(stats_cells) < len(stats_headers):
+                continue
             
-            if len(name_rows) != len(stats_rows):
-                print(f"    Warning: Name table has {len(name_rows)} rows, stats table has {len(stats_rows)} rows")
+            # Build row data dictionary (Player and Team are split from the name below)
+            name_texts.append(name_text)
+            row_data = {
+                'RK': rk,
+                'Player': None,
+                'Team': None
+            }
             
-            # Parse all rows and combine data
-            data_rows = []
-            min_rows = min(len(name_rows), len(stats_rows))
+            # Add all stats columns
+            for j, header in enumerate(stats_headers):
+                if j < len(stats_cells):
+                    row_data[header] = stats_cells[j]
             
-            for i in range(min_rows):
-                # Parse name table row
-                name_cells = name_rows[i].find_elements(By.TAG_NAME, 'td')
-                if len(name_cells) < 2:
-                    continue
-                
-                rk = name_cells[0].text.strip()
-                name_text = name_cells[1].text.strip()
-                player_name, team = self.extract_player_name_and_team(name_text)
-                
-                # Parse stats table row
-                stats_cells = stats_rows[i].find_elements(By.TAG_NAME, 'td')
-                if len(stats_cells) < len(stats_headers):
-                    continue
-                
-                # Build row data dictionary
-                row_data = {
-                    'RK': rk,
-                    'Player': player_name,
-                    'Team': team
-                }
-                
-                # Add all stats columns
-                for j, header in enumerate(stats_headers):
-                    if j < len(stats_cells):
-                        row_data[header] = stats_cells[j].text.strip()
-                
-                data_rows.append(row_data)
+            data_rows.append(row_data)
+        
+        # Split every "PlayerNameTEAM" string in one vectorized pass
+        players, teams = self.split_player_and_team(name_texts)
+        for row_data, player_name, team in zip(data_rows, players, teams):
+            row_data['Player'] = player_name
+            row_data['Team'] = team
+        
+        return data_rows
+    
+    def scrape_data(self, year, prefetched=None):
+        """Scrape player statistics from ESPN website (optionally from an already fetched API response)"""
+        # Skip the scrape entirely if this year was already scraped recently
+        if self.is_cached(year):
+            print(f"    Using cached data for year {year}")
+            return pd.read_parquet(self.get_partition_path(year))
+        
+        try:
+            # The stats page is backed by a JSON API that returns every player in one
+            # request; fall back to the browser if the API is unavailable or changes shape
+            try:
+                data_rows = self._fetch_api_rows(year, prefetched)
+            except Exception as e:
+                print(f"    ESPN API fetch failed for year {year} ({e}), falling back to browser...")
+                data_rows = self._load_rows_with_driver(year)
             
             # Create DataFrame from parsed data
-            df = pd.DataFrame(data_rows)
+            df = self._convert_dtypes(pd.DataFrame(data_rows))
             
             # Add year column to track which year the data is from
             df['Year'] = year
+            df = self._order_columns(df)
             
             print(f"    Extracted {len(df)} rows of data with {len(df.columns)} columns")
+            
+            # An empty file would be reused as a cached year, so fail the year instead
+            if df.empty:
+                raise ValueError(f"No player rows extracted for year {year}")
+            
+            # Save the year to the parquet store right away so re-runs can skip it
+            self._write_partition(df, year)
             return df
             
         except Exception as e:
             print(f"Error scraping data for year {year}: {e}")
             raise
     
-    def append_to_excel(self, df):
-        """Append DataFrame to existing Excel file"""
-        if df.empty:
-            print("No data to append")
-            return self.excel_path
+    def _convert_dtypes(self, df):
+        """Strip the text columns and store labels as categories and stats as numbers"""
+        columns = [col for col in df.columns if col != 'Year']
         
-        # Check for existing file
-        existing_df = None
-        if os.path.exists(self.excel_path):
-            try:
-                existing_df = pd.read_excel(self.excel_path, sheet_name='Sheet1', engine='openpyxl')
-                # Check if file actually has data
-                if existing_df.empty or len(existing_df.columns) == 0:
-                    existing_df = None
-                    print(f"Existing file was empty, starting fresh")
-            except Exception as e:
-                print(f"Could not read existing file: {e}, starting fresh")
-                existing_df = None
+        # Strip whitespace a column at a time rather than once per cell (scraped
+        # columns are raw text; pandas 3 gives these a str dtype, not object)
+        for col in columns:
+            df[col] = _strip_text(df[col])
         
-        # Process data
-        if existing_df is not None and not existing_df.empty:
-            # Get all unique columns from both dataframes
-            all_columns = sorted(list(set(df.columns.tolist() + existing_df.columns.tolist())))
-            
-            # Ensure both dataframes have all columns
-            for col in all_columns:
-                if col not in df.columns:
-                    df[col] = None
-                if col not in existing_df.columns:
-                    existing_df[col] = None
-            
-            # Reorder columns: RK, Player, Team first, then alphabetical stats, Year last
-            priority_cols = ['RK', 'Player', 'Team']
-            other_cols = sorted([col for col in all_columns if col not in priority_cols and col != 'Year'])
-            column_order = priority_cols + other_cols + (['Year'] if 'Year' in all_columns else [])
-            column_order = [col for col in column_order if col in all_columns]
-            
-            df = df[column_order]
-            existing_df = existing_df[column_order]
-            
-            # Filter out rows for the same year (to avoid duplicates when re-running)
-            if 'Year' in df.columns and 'Year' in existing_df.columns:
-                year_to_append = df['Year'].iloc[0] if len(df) > 0 else None
-                if year_to_append is not None:
-                    existing_df = existing_df[existing_df['Year'] != year_to_append]
-            
-            # Combine existing and new data
-            combined_df = pd.concat([existing_df, df], ignore_index=True)
-            print(f"Appended {len(df)} new rows to existing {len(existing_df)} rows")
-        else:
-            # No existing data or file doesn't exist, use new data
-            # Reorder columns: RK, Player, Team first, then alphabetical stats, Year last
-            priority_cols = ['RK', 'Player', 'Team']
-            other_cols = sorted([col for col in df.columns if col not in priority_cols and col != 'Year'])
-            column_order = priority_cols + other_cols + (['Year'] if 'Year' in df.columns else [])
-            column_order = [col for col in column_order if col in df.columns]
-            combined_df = df[column_order]
-            
-            if existing_df is None:
-                print(f"Creating new file with {len(df)} rows")
-            else:
-                print(f"File was empty, writing {len(df)} new rows")
+        # Team and POS repeat heavily across rows, so store them as categories
+        for col in ['Team', 'POS']:
+            if col in df.columns:
+                df[col] = df[col].astype('category')
+        
+        # Everything else is a stat - store it as a numeric dtype
+        numeric_cols = [col for col in columns if col not in ('Player', 'Team', 'POS')]
+        df[numeric_cols] = df[numeric_cols].apply(_downcast_numeric)
+        
+        return df
+    
+    def _order_columns(self, df):
+        """Reorder columns: RK, Player, Team first, then alphabetical stats, Year last"""
+        priority_cols = ['RK', 'Player', 'Team']
+        other_cols = sorted([col for col in df.columns if col not in priority_cols and col != 'Year'])
+        column_order = priority_cols + other_cols + (['Year'] if 'Year' in df.columns else [])
+        column_order = [col for col in column_order if col in df.columns]
+        return df[column_order]
+    
+    def _write_partition(self, df, year):
+        """Atomically write one year's file so an interrupted run never leaves a partial file"""
+        os.makedirs(self.parquet_dir, exist_ok=True)
+        partition_path = self.get_partition_path(year)
+        tmp_path = f"{partition_path}.tmp"
+        df.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, partition_path)
+    
+    def _write_partitions(self, df):
+        """Write each year in the DataFrame to its own file in the parquet store"""
+        # One file per year, so re-running a year replaces it instead of duplicating rows
+        for year, year_df in df.groupby('Year'):
+            self._write_partition(year_df, year)
+    
+    def _read_excel(self):
+        """Read the existing Excel file, preferring the much faster calamine reader"""
+        try:
+            return pd.read_excel(self.excel_path, sheet_name='Sheet1', engine='calamine')
+        except (ImportError, ValueError):
+            # python-calamine not installed (or pandas too old to know the engine)
+            return pd.read_excel(self.excel_path, sheet_name='Sheet1', engine='openpyxl')
+    
+    def migrate_excel(self):
+        """Seed an empty parquet store from an existing Excel file"""
+        if glob(os.path.join(self.parquet_dir, 'year=*.parquet')) or not os.path.exists(self.excel_path):
+            return
+        
+        try:
+            existing_df = self._read_excel()
+        except Exception as e:
+            print(f"Could not read existing file: {e}, starting fresh")
+            return
+        
+        # Check if file actually has data
+        if existing_df.empty or 'Year' not in existing_df.columns:
+            print(f"Existing file was empty, starting fresh")
+            return
+        
+        # Rows without a usable Year can't go in a year file; the rest need int years
+        # so their files are named like the scraped ones (year=2024, not year=2024.0)
+        existing_df['Year'] = pd.to_numeric(existing_df['Year'], errors='coerce')
+        existing_df = existing_df.dropna(subset=['Year'])
+        if existing_df.empty:
+            print(f"Existing file had no rows with a Year, starting fresh")
+            return
+        existing_df['Year'] = existing_df['Year'].astype(int)
+        
+        print(f"Migrating {len(existing_df)} rows from {self.excel_path} to {self.parquet_dir}")
+        # Give the migrated years the same dtypes as freshly scraped ones
+        self._write_partitions(self._convert_dtypes(self._order_columns(existing_df).copy()))
+        # Date the migrated years by the Excel file so they age out of the cache normally
+        excel_mtime = os.path.getmtime(self.excel_path)
+        for year in existing_df['Year'].unique():
+            os.utime(self.get_partition_path(year), (excel_mtime, excel_mtime))
+    
+    def _read_partitions(self, skip_years=()):
+        """Read every year file in the parquet store except skip_years, one DataFrame per file"""
+        skip_paths = {self.get_partition_path(year) for year in skip_years}
+        partition_paths = sorted(glob(os.path.join(self.parquet_dir, 'year=*.parquet')))
+        return [pd.read_parquet(path) for path in partition_paths if path not in skip_paths]
+    
+    def export_to_excel(self, scraped=None):
+        """Write every year to a single Excel file, taking the years in scraped (year -> DataFrame) from memory"""
+        scraped = scraped or {}
+        # Years scraped this run are already in memory, so only the other years are read from the store
+        frames = self._read_partitions(skip_years=scraped) + list(scraped.values())
+        if not frames:
+            print("No data to export")
+            return self.excel_path
+        combined_df = pd.concat(frames, ignore_index=True).sort_values('Year', kind='stable', ignore_index=True)
+        combined_df = self._order_columns(combined_df)
         
         # Write to Excel file (overwrites the existing sheet)
         try:
@@ -280,41 +518,82 @@ class NBAScraper:
         return self.excel_path
 
 
+# One scraper (and browser session) per worker process, reused across its years
+_worker_scraper = None
+
+
+def _init_worker(driver_path, install_lock):
+    """Create the worker's scraper and quit its browser when the worker exits"""
+    # Selenium is not fork-safe, so each worker builds its own scraper and driver
+    global _worker_scraper
+    _worker_scraper = NBAScraper(driver_path, install_lock)
+    Finalize(_worker_scraper, _worker_scraper.close_driver, exitpriority=10)
+
+
+def scrape_one_year(year, prefetched=None):
+    """Scrape a single year in a worker process and return its DataFrame"""
+    # scrape_data also writes the year to the parquet store (or reuses a cached one),
+    # so a crash mid-run doesn't lose finished years
+    return _worker_scraper.scrape_data(year, prefetched)
+
+
 if __name__ == "__main__":
     scraper = NBAScraper()
+    max_workers = 4
     
-    try:
-        # Loop through years from 2002 to 2025 (inclusive)
-        years = range(2002, 2026)  # Goes from 2002 to 2025
-        total_years = len(years)
-        successful = 0
-        failed = 0
-        
-        print(f"Starting to scrape data for {total_years} years (2002 to 2025)...")
-        print("=" * 60)
-        
-        for i, year in enumerate(years, 1):
+    # Loop through years from 2002 to 2025 (inclusive)
+    years = range(2002, 2026)
+    total_years = len(years)
+    successful = 0
+    failed = 0
+    scraped = {}
+    
+    # Bring an existing Excel file into the parquet store before checking what's done
+    scraper.migrate_excel()
+    
+    # Years already in the store from an earlier (possibly interrupted) run are
+    # not scraped again
+    remaining_years = [year for year in years if not scraper.is_cached(year)]
+    reused = total_years - len(remaining_years)
+    
+    print(f"Starting to scrape data for {total_years} years (2002 to 2025) with {max_workers} workers...")
+    print(f"Reusing {reused} already scraped years, {len(remaining_years)} left to scrape")
+    print("=" * 60)
+    
+    # Download the API responses for every remaining year concurrently up front;
+    # workers parse them and only open a browser when a page is unusable
+    pages = asyncio.run(scraper.fetch_pages(remaining_years))
+    
+    # A year whose page couldn't be downloaded will need a browser, so resolve chromedriver
+    # once here; otherwise workers resolve it (one at a time) only if a page is unusable
+    driver_path = None
+    if any(year not in pages for year in remaining_years):
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            print(f"Could not resolve chromedriver ({e}), workers will retry if they need a browser")
+    
+    # Each year is I/O-bound (browser + network), so run them in parallel processes
+    with ProcessPoolExecutor(max_workers=max_workers, initializer=_init_worker, initargs=(driver_path, Lock())) as executor:
+        futures = {executor.submit(scrape_one_year, year, pages.get(year)): year for year in remaining_years}
+        for i, future in enumerate(as_completed(futures), 1):
+            year = futures[future]
             try:
-                print(f"\n[{i}/{total_years}] Scraping data for year {year}...")
-                df = scraper.scrape_data(year)
-                print(f"Successfully scraped {len(df)} rows for year {year}")
-                
-                scraper.append_to_excel(df)
+                df = future.result()
+                scraped[year] = df
                 successful += 1
-                print(f"✓ Year {year} completed successfully")
-                
+                print(f"[{i}/{len(remaining_years)}] ✓ Year {year} completed successfully ({len(df)} rows)")
             except Exception as e:
                 failed += 1
-                print(f"✗ Error scraping year {year}: {e}")
-                print(f"Continuing with next year...")
-        
-        print("\n" + "=" * 60)
-        print(f"Scraping completed!")
-        print(f"Successfully scraped: {successful} years")
-        print(f"Failed: {failed} years")
-        print(f"Total years processed: {successful + failed}/{total_years}")
-        
-    finally:
-        # Always close the driver
-        scraper.close_driver()
-        print("\nBrowser driver closed.")
+                print(f"[{i}/{len(remaining_years)}] ✗ Error scraping year {year}: {e}")
+    
+    # Export Excel once: this run's years from memory, reused years from the parquet store
+    if successful or reused:
+        scraper.export_to_excel(scraped)
+    
+    print("\n" + "=" * 60)
+    print(f"Scraping completed!")
+    print(f"Successfully scraped: {successful} years")
+    print(f"Failed: {failed} years")
+    print(f"Reused from earlier runs: {reused} years")
+    print(f"Total years processed: {successful + failed + reused}/{total_years}")